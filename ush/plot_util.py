@@ -19,6 +19,7 @@ from scipy.interpolate import interp1d
 import warnings
 import re
 import math
+from functools import lru_cache
 warnings.filterwarnings('ignore')
 """!@namespace plot_util
    @brief Provides utility functions for PGC plotting use case
@@ -468,14 +469,10 @@ def calculate_bootstrap_ci(logger, bs_method, model_data, stat, nrepl, level,
             rep_arr = np.arange(0,nrepl)
             for b in range(0, nrepl, batch_size):
                curr_batch_size = len(rep_arr[b:b+batch_size])
-               idxs = [
-                  np.random.choice(
-                     len(fo_matched_est), 
-                     size=fo_matched_est.size, 
-                     replace=True
-                  ) 
-                  for _ in range(curr_batch_size)
-               ]
+               idxs = np.random.randint(
+                  0, len(fo_matched_est), 
+                  size=(curr_batch_size, fo_matched_est.size)
+               )
                f_est_bs, o_est_bs = [
                   np.take(fo_matched_est.T[i], idxs) for i in [0,1]
                ]
@@ -509,25 +506,20 @@ def calculate_bootstrap_ci(logger, bs_method, model_data, stat, nrepl, level,
       upper_pctile = 100.-lower_pctile
       if line_type in ['MCTC','CTC','NBRCTC']:
          ctc = np.array([fy_oy, fy_on, fn_oy, fn_on])
-         fy_oy_samp, fy_on_samp, fn_oy_samp, fn_on_samp = [
-            [] for item in range(4)
-         ]
-         for _ in range(nrepl):
-            ctc_bs = ctc.T[
-               np.random.choice(
-                  range(len(ctc.T)), 
-                  size=len(ctc.T), 
-                  replace=True
-               )
-            ].sum(axis=0)
-            fy_oy_samp.append(ctc_bs[0])
-            fy_on_samp.append(ctc_bs[1])
-            fn_oy_samp.append(ctc_bs[2])
-            fn_on_samp.append(ctc_bs[3])
-         fy_oy_samp = np.array(fy_oy_samp)
-         fy_on_samp = np.array(fy_on_samp)
-         fn_oy_samp = np.array(fn_oy_samp)
-         fn_on_samp = np.array(fn_on_samp)
+         max_mem_per_array = 32 # MB
+         max_array_size = max_mem_per_array*1E6/8
+         batch_size = max(int(max_array_size/ctc.size), 1)
+         ctc_samples = []
+         # resample all replicates of a batch at once
+         for b in range(0, nrepl, batch_size):
+            curr_batch_size = min(batch_size, nrepl-b)
+            idxs = np.random.randint(
+               0, len(ctc.T), size=(curr_batch_size, len(ctc.T))
+            )
+            ctc_samples.append(np.take(ctc, idxs, axis=1).sum(axis=2))
+         fy_oy_samp, fy_on_samp, fn_oy_samp, fn_on_samp = np.concatenate(
+            ctc_samples, axis=1
+         )
       elif line_type == 'SL1L2':
          fbar_est_mean = fbar.mean()
          obar_est_mean = obar.mean()
@@ -569,14 +561,9 @@ def calculate_bootstrap_ci(logger, bs_method, model_data, stat, nrepl, level,
             rep_arr = np.arange(0,nrepl)
             for b in range(0, nrepl, batch_size):
                curr_batch_size = len(rep_arr[b:b+batch_size])
-               idxs = [
-                  np.random.choice(
-                     len(fbar), 
-                     size=fbar.size, 
-                     replace=True
-                  ) 
-                  for _ in range(curr_batch_size)
-               ]
+               idxs = np.random.randint(
+                  0, len(fbar), size=(curr_batch_size, fbar.size)
+               )
                fbar_bs, obar_bs, fobar_bs, ffbar_bs, oobar_bs = [
                   np.take(np.array(summary_stat), idxs) 
                   for s, summary_stat in enumerate([fbar, obar, fobar, ffbar, oobar])
@@ -636,14 +623,9 @@ def calculate_bootstrap_ci(logger, bs_method, model_data, stat, nrepl, level,
             rep_arr = np.arange(0,nrepl)
             for b in range(0, nrepl, batch_size):
                curr_batch_size = len(rep_arr[b:b+batch_size])
-               idxs = [
-                  np.random.choice(
-                     len(fbs),
-                     size=fbs.size,
-                     replace=True
-                  )
-                  for _ in range(curr_batch_size)
-               ]
+               idxs = np.random.randint(
+                  0, len(fbs), size=(curr_batch_size, fbs.size)
+               )
                fbs_bs, fss_bs, afss_bs, ufss_bs, frate_bs, orate_bs = [
                   np.take(np.array(summary_stat), idxs)
                   for s, summary_stat in enumerate([fbs, fss, afss, ufss, frate, orate])
@@ -1566,9 +1548,9 @@ def configure_leads_axis(df, y_min, y_max, y_min_limit, y_max_limit, thresh_labe
 
     # Generate labels
     if str(var_long_name_key).upper() == 'HGT':
-        if str(df['OBS_VAR'].tolist()[0]).upper() in ['CEILING']:
+        if str(df['OBS_VAR'].iat[0]).upper() in ['CEILING']:
             var_long_name_key = 'HGTCLDCEIL'
-        elif str(df['OBS_VAR'].tolist()[0]).upper() in ['HPBL']:
+        elif str(df['OBS_VAR'].iat[0]).upper() in ['HPBL']:
             var_long_name_key = 'HPBL'
     var_long_name = variable_translator[var_long_name_key]
     if unit_convert:
@@ -1691,9 +1673,9 @@ def configure_stats_axis(df, y_min, y_max, y_min_limit, y_max_limit, thresh_labe
 
     # Adjust variable long name key based on observed variable
     if str(var_long_name_key).upper() == 'HGT':
-        if str(df['OBS_VAR'].tolist()[0]).upper() in ['CEILING']:
+        if str(df['OBS_VAR'].iat[0]).upper() in ['CEILING']:
             var_long_name_key = 'HGTCLDCEIL'
-        elif str(df['OBS_VAR'].tolist()[0]).upper() in ['HPBL']:
+        elif str(df['OBS_VAR'].iat[0]).upper() in ['HPBL']:
             var_long_name_key = 'HPBL'
 
     # Get descriptive var name
@@ -1948,7 +1930,7 @@ def filter_by_width(logger, df, interp_pts):
     """
     # Check if interp_pts is not empty or contains empty strings
     if interp_pts and '' not in interp_pts:
-        interp_shape = list(df['INTERP_MTHD'])[0]
+        interp_shape = df['INTERP_MTHD'].iat[0]
         if 'SQUARE' in interp_shape:
             widths = [int(np.sqrt(float(p))) for p in interp_pts]
         elif 'CIRCLE' in interp_shape:
@@ -2010,6 +1992,7 @@ def first_january_index(datetime_list):
             return idx
     return 0
 
+@lru_cache(maxsize=512)
 def format_thresh(thresh):
    """! Format thresholds for file naming
       Args:
@@ -2108,7 +2091,7 @@ def get_domain_info(df, domain_translator):
            from the dictionary or the domain itself if not found)
     """
     # Extract the first value from the 'VX_MASK' column as the domain key
-    domain = df['VX_MASK'].tolist()[0]
+    domain = df['VX_MASK'].iat[0]
 
     # Set the domain long name and save name
     if domain in list(domain_translator.keys()):
@@ -2630,18 +2613,41 @@ def get_pivot_tables(df_aggregated, metric1_name, metric2_name,
     else:
         raise ValueError(f"Unknown plot_type: {plot_type}")
     
+    # Average every pivoted column in a single groupby pass, then unstack
+    # each one.  Rows and columns that are entirely NaN are dropped to match
+    # pd.pivot_table
+    value_cols = [str(metric1_name).upper()]
+    if metric2_name is not None:
+        value_cols.append(str(metric2_name).upper())
+    if sample_equalization:
+        value_cols.append('COUNTS')
+    if confidence_intervals:
+        value_cols.extend([
+            str(metric1_name).upper()+'_BLERR', 
+            str(metric1_name).upper()+'_BUERR'
+        ])
+        if metric2_name is not None:
+            value_cols.extend([
+                str(metric2_name).upper()+'_BLERR', 
+                str(metric2_name).upper()+'_BUERR'
+            ])
+    df_means = df_aggregated.groupby(
+        [index_colname, colname], observed=True
+    )[value_cols].mean()
+    def pivot_mean(value_col):
+        return (
+            df_means[value_col]
+            .unstack(colname)
+            .dropna(how='all')
+            .dropna(axis=1, how='all')
+        )
+
     # Create pivot table for the first metric
-    pivot_metric1 = pd.pivot_table(
-        df_aggregated, values=str(metric1_name).upper(), columns=colname, 
-        index=index_colname, aggfunc=np.nanmean
-    )
+    pivot_metric1 = pivot_mean(str(metric1_name).upper())
     
     # Optionally create a pivot table for counts
     if sample_equalization:
-        pivot_counts = pd.pivot_table(
-            df_aggregated, values='COUNTS', columns=colname,
-            index=index_colname
-        )
+        pivot_counts = pivot_mean('COUNTS')
     else:
         pivot_counts = None
 
@@ -2651,10 +2657,7 @@ def get_pivot_tables(df_aggregated, metric1_name, metric2_name,
     
     # Create pivot table for the second metric if provided 
     if metric2_name is not None:
-        pivot_metric2 = pd.pivot_table(
-            df_aggregated, values=str(metric2_name).upper(), columns=colname, 
-            index=index_colname, aggfunc=np.nanmean
-        )
+        pivot_metric2 = pivot_mean(str(metric2_name).upper())
         if keep_shared_events_only:
             pivot_metric2 = pivot_metric2.dropna()
     else:
@@ -2662,23 +2665,11 @@ def get_pivot_tables(df_aggregated, metric1_name, metric2_name,
 
     # Handle confidence intervals
     if confidence_intervals:
-        pivot_ci_lower1 = pd.pivot_table(
-            df_aggregated, values=str(metric1_name).upper()+'_BLERR',
-            columns=colname, index=index_colname
-        )
-        pivot_ci_upper1 = pd.pivot_table(
-            df_aggregated, values=str(metric1_name).upper()+'_BUERR',
-            columns=colname, index=index_colname
-        )
+        pivot_ci_lower1 = pivot_mean(str(metric1_name).upper()+'_BLERR')
+        pivot_ci_upper1 = pivot_mean(str(metric1_name).upper()+'_BUERR')
         if metric2_name is not None:
-            pivot_ci_lower2 = pd.pivot_table(
-                df_aggregated, values=str(metric2_name).upper()+'_BLERR',
-                columns=colname, index=index_colname
-            )
-            pivot_ci_upper2 = pd.pivot_table(
-                df_aggregated, values=str(metric2_name).upper()+'_BUERR',
-                columns=colname, index=index_colname
-            )
+            pivot_ci_lower2 = pivot_mean(str(metric2_name).upper()+'_BLERR')
+            pivot_ci_upper2 = pivot_mean(str(metric2_name).upper()+'_BUERR')
         else:
             pivot_ci_lower2 = None
             pivot_ci_upper2 = None
@@ -3121,16 +3112,16 @@ def get_var_info(df):
     - str: The standardized variable save name (var_savename)
     """
     # Start with the first value from the 'FCST_VAR' column
-    var_savename = df['FCST_VAR'].tolist()[0]
+    var_savename = df['FCST_VAR'].iat[0]
 
     # Standardize save names based on specific conditions
     if 'APCP' in var_savename.upper():
         var_savename = 'APCP'
     elif any(field in var_savename.upper() for field in ['ASNOW','SNOD']):
         var_savename = 'ASNOW'
-    elif str(df['OBS_VAR'].tolist()[0]).upper() in ['HPBL']:
+    elif str(df['OBS_VAR'].iat[0]).upper() in ['HPBL']:
         var_savename = 'HPBL'
-    elif str(df['OBS_VAR'].tolist()[0]).upper() in ['MSLET','MSLMA','PRMSL']:
+    elif str(df['OBS_VAR'].iat[0]).upper() in ['MSLET','MSLMA','PRMSL']:
         var_savename = 'MSLET'
 
     return var_savename
@@ -3267,21 +3258,21 @@ def process_stats(logger, df, df_groups, model_list, flead, metric1_name, metric
     ]
 
     # Get the forecast units from the first row of the DataFrame
-    units = df['FCST_UNITS'].tolist()[0]
+    units = df['FCST_UNITS'].iat[0]
 
     # Check if unit conversion is needed and apply
     coef, const = (None, None)
     unit_convert = False
     if units in reference.unit_conversions:
         unit_convert = True
-        var_long_name_key = df['FCST_VAR'].tolist()[0]
+        var_long_name_key = df['FCST_VAR'].iat[0]
         if str(var_long_name_key).upper() == 'HGT':
-            if str(df['OBS_VAR'].tolist()[0]).upper() in ['CEILING']:
+            if str(df['OBS_VAR'].iat[0]).upper() in ['CEILING']:
                 if units in ['m','gpm']:
                     units = 'gpm'
-            elif str(df['OBS_VAR'].tolist()[0]).upper() in ['HPBL']:
+            elif str(df['OBS_VAR'].iat[0]).upper() in ['HPBL']:
                 unit_convert = False
-            elif str(df['OBS_VAR'].tolist()[0]).upper() in ['HGT']:
+            elif str(df['OBS_VAR'].iat[0]).upper() in ['HGT']:
                 unit_convert = False
         elif any(field in str(var_long_name_key).upper() for field in ['WEASD', 'SNOD', 'ASNOW']):
             if units in ['m']:
@@ -8,12 +8,12 @@
 # =============================================================================
 
 import matplotlib.pyplot as plt
-from matplotlib.collections import PatchCollection
+from matplotlib.collections import PatchCollection, LineCollection
+from matplotlib.lines import Line2D
 from matplotlib.patches import Rectangle, PathPatch
 from matplotlib.path import Path
 import numpy as np
 import pandas as pd
-import math
 import os
 import sys
 SETTINGS_DIR = os.environ['USH_DIR']
@@ -68,9 +68,10 @@ class Plotter():
         self.lines_line_width = lines_line_width
         self.title_loc = title_loc
         self.title_color = title_color
-        self.f = lambda m,c,ls,lw,ms,mec: plt.plot(
-            [], [], marker=m, mec=mec, mew=2., c=c, ls=ls, lw=lw, ms=ms
-        )[0]
+        self.f = lambda m,c,ls,lw,ms,mec: Line2D(
+            [], [], marker=m, mec=mec, mew=2., color=c, ls=ls, lw=lw, ms=ms
+        )
+        self.figure_pool = {}
 
     def set_up_plots(self):
         plt.rcParams['axes.formatter.useoffset'] = self.axis_offset
@@ -106,6 +107,29 @@ class Plotter():
         fig, ax = plt.subplots(1, 1, figsize=self.fig_size, num=num)
         return fig, ax
 
+    def get_pooled_plots(self, dpi):
+        """! Get a figure and axes that are kept open and reused by every 
+             plot with the same dpi, rather than creating a new figure for 
+             each plot
+
+            Args:
+                dpi - image dots per inch (float)
+
+            Returns:
+                fig - figure, made current and otherwise left as is 
+                      (matplotlib Figure)
+                ax  - axes of fig, cleared (matplotlib Axes)
+        """
+        if dpi in self.figure_pool:
+            fig, ax = self.figure_pool[dpi]
+            plt.figure(fig.number)
+            ax.cla()
+            ax.set_prop_cycle(None)
+        else:
+            fig, ax = plt.subplots(1, 1, figsize=self.fig_size, dpi=dpi)
+            self.figure_pool[dpi] = (fig, ax)
+        return fig, ax
+
     def get_error_boxes(self, xdata, ydata, xerror, yerror, fc='None', 
                        ec='black', lw=1., ls='solid', alpha=0.75):
         errorboxes = []
@@ -146,6 +170,158 @@ class Plotter():
         )
         return pp
 
+    def get_errorbar_collection(self, ax, bars, capsize=10., alpha=.70):
+        """! Draw several sets of error bars as one LineCollection, with caps
+             drawn as one scatter
+
+            Args:
+                ax      - axes on which to draw the error bars (matplotlib 
+                          Axes)
+                bars    - list of dictionaries with 'x' and 'y' values 
+                          (numeric arrays), 'lower' and 'upper' error 
+                          magnitudes (numeric arrays), and 'color' and 
+                          'linewidth' settings for each set of error bars
+                capsize - length of the error bar caps in points (float)
+                alpha   - alpha value shared by all error bars (float)
+
+            Returns:
+                lc      - line collection added to ax (LineCollection)
+        """
+        x_all = np.concatenate([bar['x'] for bar in bars])
+        y_lower_all = np.concatenate([
+            np.asarray(bar['y'], dtype=float)
+            - np.abs(np.asarray(bar['lower'], dtype=float)) 
+            for bar in bars
+        ])
+        y_upper_all = np.concatenate([
+            np.asarray(bar['y'], dtype=float)
+            + np.asarray(bar['upper'], dtype=float) 
+            for bar in bars
+        ])
+        colors_all = [
+            bar['color'] for bar in bars for _ in range(len(bar['x']))
+        ]
+        lws_all = np.concatenate([
+            np.full(len(bar['x']), float(bar['linewidth'])) for bar in bars
+        ])
+        lc = ax.vlines(
+            x_all, y_lower_all, y_upper_all, colors=colors_all, 
+            linewidths=lws_all, alpha=alpha, zorder=0
+        )
+        ax.scatter(
+            np.concatenate((x_all, x_all)), 
+            np.concatenate((y_lower_all, y_upper_all)),
+            s=(2.*capsize)**2, c=colors_all+colors_all, marker='_', 
+            linewidths=np.concatenate((lws_all, lws_all)), alpha=alpha, 
+            zorder=0
+        )
+        return lc
+
+    def get_line_collection(self, ax, lines, ls='solid'):
+        """! Draw several lines as one LineCollection, with markers drawn as
+             one scatter per marker style
+
+            Args:
+                ax    - axes on which to draw the lines (matplotlib Axes)
+                lines - list of dictionaries with 'x' and 'y' values (numeric 
+                        arrays) and 'color', 'marker', 'linewidth', and 
+                        'markersize' settings for each line
+                ls    - line style shared by all lines (string)
+
+            Returns:
+                lc    - line collection added to ax (LineCollection)
+        """
+        if ls == 'solid':
+            capstyle = plt.rcParams['lines.solid_capstyle']
+        else:
+            capstyle = plt.rcParams['lines.dash_capstyle']
+        # Lines sit at the zorder of plt.plot lines, so they stack with the 
+        # other lines (e.g., reference lines) as before; markers sit just 
+        # above them
+        lc = LineCollection(
+            [np.column_stack((line['x'], line['y'])) for line in lines],
+            colors=[line['color'] for line in lines], 
+            linewidths=[line['linewidth'] for line in lines], linestyles=ls,
+            capstyle=capstyle, joinstyle='round', zorder=2
+        )
+        ax.add_collection(lc)
+        for marker in dict.fromkeys(line['marker'] for line in lines):
+            marker_lines = [line for line in lines if line['marker'] == marker]
+            ax.scatter(
+                np.concatenate([line['x'] for line in marker_lines]),
+                np.concatenate([line['y'] for line in marker_lines]),
+                s=np.concatenate([
+                    np.full(len(line['x']), float(line['markersize'])**2)
+                    for line in marker_lines
+                ]),
+                c=[
+                    line['color'] for line in marker_lines 
+                    for _ in range(len(line['x']))
+                ],
+                marker=marker, edgecolors='white', linewidths=2., 
+                zorder=lc.get_zorder()+.5
+            )
+        ax.autoscale_view()
+        return lc
+
+    def _get_y_limits(self, y_vals_all, y_min, y_max, y_min_limit, 
+                      y_max_limit, y_lim_lock):
+        """! Fit the y-axis limits to the plotted values, within the limits 
+             set by y_min_limit and y_max_limit, unless they are locked
+
+            Args:
+                y_vals_all  - all plotted values (numeric array)
+                y_min       - current lower y-axis limit (float)
+                y_max       - current upper y-axis limit (float)
+                y_min_limit - lowest allowed lower y-axis limit (float)
+                y_max_limit - highest allowed upper y-axis limit (float)
+                y_lim_lock  - if True, keep the current limits (bool)
+
+            Returns:
+                y_min       - lower y-axis limit (float)
+                y_max       - upper y-axis limit (float)
+        """
+        # NaNs and infinite values are ignored
+        y_vals_all = np.where(np.isinf(y_vals_all), np.nan, y_vals_all)
+        if not y_lim_lock and y_vals_all.size > 0:
+            y_mod_min = np.nanmin(y_vals_all)
+            y_mod_max = np.nanmax(y_vals_all)
+            if y_mod_min > y_min_limit:
+                y_min = y_mod_min
+            if y_mod_max < y_max_limit:
+                y_max = y_mod_max
+        return (y_min, y_max)
+
+    def _get_plot_names(self, model_list, model_colors):
+        """! Get the plot name of each model, and all of them joined
+
+            Args:
+                model_list      - names of the models (list of strings)
+                model_colors    - model settings, including any plot name 
+                                  aliases (ModelSpecs)
+
+            Returns:
+                plot_names      - plot name of each model (list of strings)
+                model_plot_name - plot names joined into one phrase (string)
+        """
+        alias_map = model_colors.model_alias
+        plot_names = [
+            alias_map[model]['plot_name'] if model in alias_map else model
+            for model in model_list
+        ]
+        if not plot_names:
+            model_plot_name = ""
+        elif len(plot_names) == 1:
+            model_plot_name = plot_names[0]
+        else:
+            model_plot_name = "".join([
+                ', '+plot_name for plot_name in plot_names[:-1]
+            ])
+            model_plot_name+=(
+                ', and '+plot_names[-1]
+            )
+        return (plot_names, model_plot_name)
+
     def get_logo_location(self, position, x_figsize, y_figsize, dpi):
         """! Get locations for the logos
 
@@ -198,6 +374,10 @@ class Plotter():
                       model_list, model_colors, setting_dicts, 
                       confidence_intervals=False, y_lim_lock=True,
                       display_averages=False, running_mean=''):
+        # Convert the x-values once, rather than on every plotting call
+        x_vals1_list = x_vals1.tolist()
+        if x_vals2 is not None:
+            x_vals2_list = x_vals2.tolist()
         if metric2_name is not None:
             handles = [
                 self.f('', 'black', line_setting, 5., 0, 'white')
@@ -210,7 +390,25 @@ class Plotter():
         else:
             handles = []
             labels = []
-        n_mods = 0
+        # Reduce the plotted values once for all lines
+        plotted_leads = [fl for fl in flead if fl in pivot_metric1.columns]
+        y_vals_all = pivot_metric1[plotted_leads].to_numpy(dtype=float)
+        metric1_means = dict(zip(
+            plotted_leads, np.nanmean(y_vals_all, axis=0)
+        ))
+        if metric2_name is not None:
+            y_vals_all2 = pivot_metric2[plotted_leads].to_numpy(dtype=float)
+            metric2_means = dict(zip(
+                plotted_leads, np.nanmean(y_vals_all2, axis=0)
+            ))
+            y_vals_all = np.concatenate((y_vals_all, y_vals_all2))
+        y_min, y_max = self._get_y_limits(
+            y_vals_all, y_min, y_max, y_min_limit, y_max_limit, y_lim_lock
+        )
+        # Resolve the model plot names once, rather than for every line
+        plot_names, model_plot_name = self._get_plot_names(
+            model_list, model_colors
+        )
         for l in range(len(flead)):
             if flead[l] >= 24 and int(flead[l])%24 in [0, 6, 12, 18]:
                 if int(flead[l])%24 == 0:
@@ -222,43 +420,11 @@ class Plotter():
                 flead_plot_name = f"F{flead[l]:03d}"
             if flead[l] not in pivot_metric1:
                 continue
-            if not model_list:
-                model_plot_name = ""
-            elif len(model_list) == 1:
-                if model_list[0] in model_colors.model_alias:
-                    model_plot_name = model_colors.model_alias[
-                        model_list[0]
-                    ]['plot_name']
-                else:
-                    model_plot_name = model_list[0]
-            else:
-                model_plot_name = ""
-                for m in range(len(model_list[:-1])):
-                    if model_list[m] in model_colors.model_alias:
-                        model_plot_name+=(
-                            ', '+model_colors.model_alias[
-                                model_list[m]
-                            ]['plot_name']
-                        )
-                    else:
-                        model_plot_name+=(
-                            ', '+model_list[m]
-                        )
-                if model_list[-1] in model_colors.model_alias:
-                    model_plot_name+=(
-                        ', and '+model_colors.model_alias[
-                            model_list[-1]
-                        ]['plot_name']
-                    )
-                else:
-                    model_plot_name+=(
-                        ', and '+model_list[-1]
-                    )
             y_vals_metric1 = pivot_metric1[flead[l]].values
-            y_vals_metric1_mean = np.nanmean(y_vals_metric1)
+            y_vals_metric1_mean = metric1_means[flead[l]]
             if metric2_name is not None:
                 y_vals_metric2 = pivot_metric2[flead[l]].values
-                y_vals_metric2_mean = np.nanmean(y_vals_metric2)
+                y_vals_metric2_mean = metric2_means[flead[l]]
             if confidence_intervals:
                 y_vals_ci_lower1 = pivot_ci_lower1[
                     flead[l]
@@ -273,42 +439,6 @@ class Plotter():
                     y_vals_ci_upper2 = pivot_ci_upper2[
                         flead[l]
                     ].values
-            if not y_lim_lock:
-                if metric2_name is not None:
-                    y_vals_both_metrics = np.concatenate((y_vals_metric1, y_vals_metric2))
-                    if np.any(y_vals_both_metrics != np.inf):
-                        y_vals_metric_min = np.nanmin(y_vals_both_metrics[y_vals_both_metrics != np.inf])
-                        y_vals_metric_max = np.nanmax(y_vals_both_metrics[y_vals_both_metrics != np.inf])
-                    else:
-                        y_vals_metric_min = np.nanmin(y_vals_both_metrics)
-                        y_vals_metric_max = np.nanmax(y_vals_both_metrics)
-                else:
-                    if np.any(y_vals_metric1 != np.inf):
-                        y_vals_metric_min = np.nanmin(y_vals_metric1[y_vals_metric1 != np.inf])
-                        y_vals_metric_max = np.nanmax(y_vals_metric1[y_vals_metric1 != np.inf])
-                    else:
-                        y_vals_metric_min = np.nanmin(y_vals_metric1)
-                        y_vals_metric_max = np.nanmax(y_vals_metric1)
-                if n_mods == 0:
-                    y_mod_min = y_vals_metric_min
-                    y_mod_max = y_vals_metric_max
-                    counts = pivot_counts[flead[l]].values
-                    n_mods+=1
-                else:
-                    if math.isinf(y_mod_min):
-                        y_mod_min = y_vals_metric_min
-                    else:
-                        y_mod_min = np.nanmin([y_mod_min, y_vals_metric_min])
-                    if math.isinf(y_mod_max):
-                        y_mod_max = y_vals_metric_max
-                    else:
-                        y_mod_max = np.nanmax([y_mod_max, y_vals_metric_max])
-                if (y_vals_metric_min > y_min_limit 
-                        and y_vals_metric_min <= y_mod_min):
-                    y_min = y_vals_metric_min
-                if (y_vals_metric_max < y_max_limit 
-                        and y_vals_metric_max >= y_mod_max):
-                    y_max = y_vals_metric_max
             if np.abs(y_vals_metric1_mean) < 1E4:
                 metric1_mean_fmt_string = f'{y_vals_metric1_mean:.2f}'
             else:
@@ -320,7 +450,7 @@ class Plotter():
                 alpha=1.0
                 show_markers=1
             plt.plot(
-                x_vals1.tolist(), y_vals_metric1, 
+                x_vals1_list, y_vals_metric1, 
                 marker=setting_dicts[l]['marker'], 
                 c=setting_dicts[l]['color'], mew=2., mec='white', 
                 figure=fig, ms=setting_dicts[l]['markersize']*float(show_markers), 
@@ -329,7 +459,7 @@ class Plotter():
             if running_mean:
                 y_vals_rolling1 = plot_util.get_rolling_mean(y_vals_metric1, running_mean)
                 plt.plot(
-                    x_vals1.tolist(), y_vals_rolling1.tolist(),
+                    x_vals1_list, y_vals_rolling1.tolist(),
                     marker=None, c=setting_dicts[l]['color'], figure=fig, 
                     ms=0., ls='solid', lw=setting_dicts[l]['linewidth']*2,
                     alpha=1.0
@@ -340,7 +470,7 @@ class Plotter():
                 else:
                     metric2_mean_fmt_string = f'{y_vals_metric2_mean:.2E}'
                 plt.plot(
-                    x_vals2.tolist(), y_vals_metric2, 
+                    x_vals2_list, y_vals_metric2, 
                     marker=setting_dicts[l]['marker'], 
                     c=setting_dicts[l]['color'], mew=2., mec='white', 
                     figure=fig, ms=setting_dicts[l]['markersize']*float(show_markers), 
@@ -349,14 +479,14 @@ class Plotter():
                 if running_mean:
                     y_vals_rolling2 = plot_util.get_rolling_mean(y_vals_metric2, running_mean)
                     plt.plot(
-                        x_vals2.tolist(), y_vals_rolling2.tolist(),
+                        x_vals2_list, y_vals_rolling2.tolist(),
                         marker=None, c=setting_dicts[l]['color'], figure=fig, 
                         ms=0., ls='dashed', lw=setting_dicts[l]['linewidth']*2,
                         alpha=1.0
                     )
             if confidence_intervals:
                 plt.errorbar(
-                    x_vals1.tolist(), y_vals_metric1,
+                    x_vals1_list, y_vals_metric1,
                     yerr=[np.abs(y_vals_ci_lower1), y_vals_ci_upper1],
                     fmt='none', ecolor=setting_dicts[l]['color'],
                     elinewidth=setting_dicts[l]['linewidth'],
@@ -365,7 +495,7 @@ class Plotter():
                 )
                 if metric2_name is not None:
                     plt.errorbar(
-                        x_vals2.tolist(), y_vals_metric2,
+                        x_vals2_list, y_vals_metric2,
                         yerr=[np.abs(y_vals_ci_lower2), y_vals_ci_upper2],
                         fmt='none', ecolor=setting_dicts[l]['color'],
                         elinewidth=setting_dicts[l]['linewidth'],
@@ -401,6 +531,10 @@ class Plotter():
                       model_list, model_colors, setting_dicts, 
                       confidence_intervals=False, y_lim_lock=True,
                       display_averages=False, running_mean='', target_vals=[0.5]):
+        # Convert the x-values once, rather than on every plotting call
+        x_vals1_list = x_vals1.tolist()
+        if x_vals2 is not None:
+            x_vals2_list = x_vals2.tolist()
         pivot_interpolated1 = plot_util.get_pivot_table_by_val(pivot_metric1, target_vals)
         pivot_counts = pivot_interpolated1.copy()
         pivot_counts[:] = np.nan
@@ -425,7 +559,24 @@ class Plotter():
         else:
             handles = []
             labels = []
-        n_mods = 0
+        # Reduce the plotted values once for all lines
+        plotted_vals = [
+            target_val for target_val in target_vals
+            if target_val in pivot_interpolated1.columns
+        ]
+        y_vals_all = pivot_interpolated1[plotted_vals].to_numpy(dtype=float)
+        metric1_means = dict(zip(
+            plotted_vals, np.nanmean(y_vals_all, axis=0)
+        ))
+        if metric2_name is not None:
+            y_vals_all2 = pivot_interpolated2[plotted_vals].to_numpy(dtype=float)
+            metric2_means = dict(zip(
+                plotted_vals, np.nanmean(y_vals_all2, axis=0)
+            ))
+            y_vals_all = np.concatenate((y_vals_all, y_vals_all2))
+        y_min, y_max = self._get_y_limits(
+            y_vals_all, y_min, y_max, y_min_limit, y_max_limit, y_lim_lock
+        )
         val_categories = np.array([
             [np.power(10.,y), 2.*np.power(10.,y)]
             for y in [-5,-4,-3,-2,-1,0,1,2,3,4,5]
@@ -445,6 +596,10 @@ class Plotter():
             target_val*val_precision_scale for target_val in target_vals
         ]
         use_vals = np.divide(use_vals, val_precision_scale)
+        # Resolve the model plot names once, rather than for every line
+        plot_names, model_plot_name = self._get_plot_names(
+            model_list, model_colors
+        )
         for v in range(len(target_vals)):
             
             if metric2_name is not None:
@@ -453,47 +608,15 @@ class Plotter():
                 val_plot_name = f"{str(metric1_name).upper()}={use_vals[v]}"
             if target_vals[v] not in pivot_interpolated1:
                 continue
-            if not model_list:
-                model_plot_name = ""
-            elif len(model_list) == 1:
-                if model_list[0] in model_colors.model_alias:
-                    model_plot_name = model_colors.model_alias[
-                        model_list[0]
-                    ]['plot_name']
-                else:
-                    model_plot_name = model_list[0]
-            else:
-                model_plot_name = ""
-                for m in range(len(model_list[:-1])):
-                    if model_list[m] in model_colors.model_alias:
-                        model_plot_name+=(
-                            ', '+model_colors.model_alias[
-                                model_list[m]
-                            ]['plot_name']
-                        )
-                    else:
-                        model_plot_name+=(
-                            ', '+model_list[m]
-                        )
-                if model_list[-1] in model_colors.model_alias:
-                    model_plot_name+=(
-                        ', and '+model_colors.model_alias[
-                            model_list[-1]
-                        ]['plot_name']
-                    )
-                else:
-                    model_plot_name+=(
-                        ', and '+model_list[-1]
-                    )
             y_vals_metric1 = np.array(
                 pivot_interpolated1[target_vals[v]].values.tolist()
             )
-            y_vals_metric1_mean = np.nanmean(y_vals_metric1)
+            y_vals_metric1_mean = metric1_means[target_vals[v]]
             if metric2_name is not None:
                 y_vals_metric2 = np.array(
                     pivot_interpolated2[target_vals[v]].values.tolist()
                 )
-                y_vals_metric2_mean = np.nanmean(y_vals_metric2)
+                y_vals_metric2_mean = metric2_means[target_vals[v]]
             if confidence_intervals:
                 y_vals_ci_lower1 = pivot_ci_lower1[
                     target_vals[v]
@@ -508,42 +631,6 @@ class Plotter():
                     y_vals_ci_upper2 = pivot_ci_upper2[
                         target_vals[v]
                     ].values.tolist()
-            if not y_lim_lock:
-                if metric2_name is not None:
-                    y_vals_both_metrics = np.concatenate((y_vals_metric1, y_vals_metric2))
-                    if np.any(y_vals_both_metrics != np.inf):
-                        y_vals_metric_min = np.nanmin(y_vals_both_metrics[y_vals_both_metrics != np.inf])
-                        y_vals_metric_max = np.nanmax(y_vals_both_metrics[y_vals_both_metrics != np.inf])
-                    else:
-                        y_vals_metric_min = np.nanmin(y_vals_both_metrics)
-                        y_vals_metric_max = np.nanmax(y_vals_both_metrics)
-                else:
-                    if np.any(y_vals_metric1 != np.inf):
-                        y_vals_metric_min = np.nanmin(y_vals_metric1[y_vals_metric1 != np.inf])
-                        y_vals_metric_max = np.nanmax(y_vals_metric1[y_vals_metric1 != np.inf])
-                    else:
-                        y_vals_metric_min = np.nanmin(y_vals_metric1)
-                        y_vals_metric_max = np.nanmax(y_vals_metric1)
-                if n_mods == 0:
-                    y_mod_min = y_vals_metric_min
-                    y_mod_max = y_vals_metric_max
-                    counts = pivot_counts[target_vals[v]].values
-                    n_mods+=1
-                else:
-                    if math.isinf(y_mod_min):
-                        y_mod_min = y_vals_metric_min
-                    else:
-                        y_mod_min = np.nanmin([y_mod_min, y_vals_metric_min])
-                    if math.isinf(y_mod_max):
-                        y_mod_max = y_vals_metric_max
-                    else:
-                        y_mod_max = np.nanmax([y_mod_max, y_vals_metric_max])
-                if (y_vals_metric_min > y_min_limit 
-                        and y_vals_metric_min <= y_mod_min):
-                    y_min = y_vals_metric_min
-                if (y_vals_metric_max < y_max_limit 
-                        and y_vals_metric_max >= y_mod_max):
-                    y_max = y_vals_metric_max
             if np.abs(y_vals_metric1_mean) < 1E4:
                 metric1_mean_fmt_string = f'{y_vals_metric1_mean:.2f}'
             else:
@@ -555,7 +642,7 @@ class Plotter():
                 alpha=1.0
                 show_markers=1
             plt.plot(
-                x_vals1.tolist(), y_vals_metric1, 
+                x_vals1_list, y_vals_metric1, 
                 marker=setting_dicts[v]['marker'], 
                 c=setting_dicts[v]['color'], mew=2., mec='white', 
                 figure=fig, ms=setting_dicts[v]['markersize']*float(show_markers), 
@@ -564,7 +651,7 @@ class Plotter():
             if running_mean:
                 y_vals_rolling1 = plot_util.get_rolling_mean(y_vals_metric1, running_mean)
                 plt.plot(
-                    x_vals1.tolist(), y_vals_rolling1.tolist(),
+                    x_vals1_list, y_vals_rolling1.tolist(),
                     marker=None, c=setting_dicts[v]['color'], figure=fig, 
                     ms=0., ls='solid', lw=setting_dicts[v]['linewidth']*2,
                     alpha=1.0
@@ -575,7 +662,7 @@ class Plotter():
                 else:
                     metric2_mean_fmt_string = f'{y_vals_metric2_mean:.2E}'
                 plt.plot(
-                    x_vals2.tolist(), y_vals_metric2, 
+                    x_vals2_list, y_vals_metric2, 
                     marker=setting_dicts[v]['marker'], 
                     c=setting_dicts[v]['color'], mew=2., mec='white', 
                     figure=fig, ms=setting_dicts[v]['markersize']*float(show_markers), 
@@ -586,14 +673,14 @@ class Plotter():
                         y_vals_metric2, running_mean
                     )
                     plt.plot(
-                        x_vals2.tolist(), y_vals_rolling2.tolist(),
+                        x_vals2_list, y_vals_rolling2.tolist(),
                         marker=None, c=setting_dicts[v]['color'], figure=fig, 
                         ms=0., ls='dashed', lw=setting_dicts[v]['linewidth'],
                         alpha=1.0
                     )
             if confidence_intervals:
                 plt.errorbar(
-                    x_vals1.tolist(), y_vals_metric1,
+                    x_vals1_list, y_vals_metric1,
                     yerr=[np.abs(y_vals_ci_lower1), y_vals_ci_upper1],
                     fmt='none', ecolor=setting_dicts[v]['color'],
                     elinewidth=setting_dicts[v]['linewidth'],
@@ -602,7 +689,7 @@ class Plotter():
                 )
                 if metric2_name is not None:
                     plt.errorbar(
-                        x_vals2.tolist(), y_vals_metric2,
+                        x_vals2_list, y_vals_metric2,
                         yerr=[np.abs(y_vals_ci_lower2), y_vals_ci_upper2],
                         fmt='none', ecolor=setting_dicts[v]['color'],
                         elinewidth=setting_dicts[v]['linewidth'],
@@ -631,15 +718,57 @@ class Plotter():
 
         return (fig, y_min, y_max, handles, labels)
 
-    def plot_by_model(self, fig, pivot_metric1, pivot_metric2, pivot_counts,
-                      pivot_ci_lower1, pivot_ci_upper1, pivot_ci_lower2, 
-                      pivot_ci_upper2, y_min, y_max, y_min_limit, y_max_limit, 
-                      x_vals1, x_vals2, metric1_name, metric2_name, 
-                      model_list, model_colors, mod_setting_dicts, 
+    def _reference_varies(self, pivot_reference, reference):
+        """! Check whether a reference metric (e.g., OBAR) differs from model 
+             to model.  Missing values are not counted as differences
+
+            Args:
+                pivot_reference - reference values, with a column for each 
+                                  model (pandas dataframe)
+                reference       - mean of pivot_reference across models 
+                                  (pandas series)
+
+            Returns:
+                varies          - True if any model's value differs from the 
+                                  mean (bool)
+        """
+        arr_reference = pivot_reference.to_numpy(dtype=float)
+        ref = reference.to_numpy(dtype=float)[:, None]
+        return not np.allclose(
+            np.where(np.isnan(arr_reference), ref, arr_reference), 
+            ref, equal_nan=True
+        )
+
+    def plot_by_model(self, fig, logger, pivot_metric1, pivot_metric2, 
+                      pivot_counts, pivot_ci_lower1, pivot_ci_upper1, 
+                      pivot_ci_lower2, pivot_ci_upper2, y_min, y_max, 
+                      y_min_limit, y_max_limit, x_vals1, x_vals2, 
+                      metric1_name, metric2_name, model_list, model_colors, 
+                      mod_setting_dicts, 
                       confidence_intervals=False, y_lim_lock=True,
                       display_averages=False):
+        # Convert the x-values once, rather than on every plotting call
+        ax = fig.gca()
+        x_vals1_list = x_vals1.tolist()
+        ax.xaxis.update_units(x_vals1_list)
+        x_nums1 = ax.xaxis.convert_units(x_vals1_list)
+        if x_vals2 is not None:
+            x_vals2_list = x_vals2.tolist()
+            ax.xaxis.update_units(x_vals2_list)
+            x_nums2 = ax.xaxis.convert_units(x_vals2_list)
+        # Model lines are collected in the loop and drawn together afterwards
+        mod_lines1 = []
+        mod_lines2 = []
+        # Confidence intervals are also collected and drawn together
+        ci_bars = []
         plot_reference = [False, False]
         ref_metrics = ['OBAR']
+        # Look up the reference line settings once for all branches
+        obs_color_dict = model_colors.get_color_dict('obs')
+        obs_color = obs_color_dict['color']
+        obs_marker = obs_color_dict['marker']
+        obs_lw = obs_color_dict['linewidth']
+        obs_ms = obs_color_dict['markersize']
         if str(metric1_name).upper() in ref_metrics:
             plot_reference[0] = True
             pivot_reference1 = pivot_metric1
@@ -647,7 +776,7 @@ class Plotter():
             if confidence_intervals:
                 reference_ci_lower1 = pivot_ci_lower1.mean(axis=1)
                 reference_ci_upper1 = pivot_ci_upper1.mean(axis=1)
-            if not np.any((pivot_reference1.T/reference1).T == 1.):
+            if self._reference_varies(pivot_reference1, reference1):
                 logger.warning(
                     f"{str(metric1_name).upper()} is requested, but the value "
                     + f"varies from model to model. "
@@ -665,7 +794,7 @@ class Plotter():
             if confidence_intervals:
                 reference_ci_lower2 = pivot_ci_lower2.mean(axis=1)
                 reference_ci_upper2 = pivot_ci_upper2.mean(axis=1)
-            if not np.any((pivot_reference2.T/reference2).T == 1.):
+            if self._reference_varies(pivot_reference2, reference2):
                 logger.warning(
                     f"{str(metric2_name).upper()} is requested, but the value "
                     + f"varies from model to model. "
@@ -682,7 +811,6 @@ class Plotter():
                 plotted_reference_CIs = [False, False]
         if metric2_name is not None:
             if np.any(plot_reference):
-                ref_color_dict = model_colors.get_color_dict('obs')
                 handles = []
                 labels = []
                 line_settings = ['solid','dashed']
@@ -690,7 +818,7 @@ class Plotter():
                 for p, rbool in enumerate(plot_reference):
                     if rbool:
                         handles += [
-                            self.f('', ref_color_dict['color'], line_settings[p], 5., 0, 'white')
+                            self.f('', obs_color, line_settings[p], 5., 0, 'white')
                         ]
                     else:
                         handles += [
@@ -711,94 +839,95 @@ class Plotter():
         else:
             handles = []
             labels = []
-        n_mods = 0
+        # Pull each pivot table into an array once, with a column index by 
+        # model name, so the model loop only slices arrays
+        arr_metric1 = pivot_metric1.to_numpy()
+        cols_metric1 = {
+            str(col): c for c, col in enumerate(pivot_metric1.columns)
+        }
+        if metric2_name is not None:
+            arr_metric2 = pivot_metric2.to_numpy()
+            cols_metric2 = {
+                str(col): c for c, col in enumerate(pivot_metric2.columns)
+            }
+        if confidence_intervals:
+            arr_ci_lower1 = pivot_ci_lower1.to_numpy()
+            arr_ci_upper1 = pivot_ci_upper1.to_numpy()
+            cols_ci1 = {
+                str(col): c for c, col in enumerate(pivot_ci_lower1.columns)
+            }
+            if metric2_name is not None:
+                arr_ci_lower2 = pivot_ci_lower2.to_numpy()
+                arr_ci_upper2 = pivot_ci_upper2.to_numpy()
+                cols_ci2 = {
+                    str(col): c 
+                    for c, col in enumerate(pivot_ci_lower2.columns)
+                }
+        # Reduce the plotted values once for all models
+        plotted_models = [
+            str(model) for model in model_list if str(model) in cols_metric1
+        ]
+        y_vals_all = arr_metric1[
+            :, [cols_metric1[model] for model in plotted_models]
+        ].astype(float)
+        metric1_means = dict(zip(
+            plotted_models, np.nanmean(y_vals_all, axis=0)
+        ))
+        if metric2_name is not None:
+            y_vals_all2 = arr_metric2[
+                :, [cols_metric2[model] for model in plotted_models]
+            ].astype(float)
+            metric2_means = dict(zip(
+                plotted_models, np.nanmean(y_vals_all2, axis=0)
+            ))
+            y_vals_all = np.concatenate((y_vals_all, y_vals_all2))
+        y_min, y_max = self._get_y_limits(
+            y_vals_all, y_min, y_max, y_min_limit, y_max_limit, y_lim_lock
+        )
+        # Resolve the model plot names once, rather than for every model
+        plot_names = self._get_plot_names(model_list, model_colors)[0]
         for m in range(len(mod_setting_dicts)):
-            if model_list[m] in model_colors.model_alias:
-                model_plot_name = (
-                    model_colors.model_alias[model_list[m]]['plot_name']
-                )
-            else:
-                model_plot_name = model_list[m]
-            if str(model_list[m]) not in pivot_metric1:
+            model_name = str(model_list[m])
+            model_plot_name = plot_names[m]
+            col_metric1 = cols_metric1.get(model_name)
+            if col_metric1 is None:
                 continue
-            y_vals_metric1 = pivot_metric1[str(model_list[m])].values
-            y_vals_metric1_mean = np.nanmean(y_vals_metric1)
+            mod_settings = mod_setting_dicts[m]
+            mod_color = mod_settings['color']
+            mod_marker = mod_settings['marker']
+            mod_lw = mod_settings['linewidth']
+            mod_ms = mod_settings['markersize']
+            y_vals_metric1 = arr_metric1[:, col_metric1]
+            y_vals_metric1_mean = metric1_means[model_name]
             if metric2_name is not None:
-                y_vals_metric2 = pivot_metric2[str(model_list[m])].values
-                y_vals_metric2_mean = np.nanmean(y_vals_metric2)
+                y_vals_metric2 = arr_metric2[:, cols_metric2[model_name]]
+                y_vals_metric2_mean = metric2_means[model_name]
             if confidence_intervals:
-                y_vals_ci_lower1 = pivot_ci_lower1[
-                    str(model_list[m])
-                ].values
-                y_vals_ci_upper1 = pivot_ci_upper1[
-                    str(model_list[m])
-                ].values
+                y_vals_ci_lower1 = arr_ci_lower1[:, cols_ci1[model_name]]
+                y_vals_ci_upper1 = arr_ci_upper1[:, cols_ci1[model_name]]
                 if metric2_name is not None:
-                    y_vals_ci_lower2 = pivot_ci_lower2[
-                        str(model_list[m])
-                    ].values
-                    y_vals_ci_upper2 = pivot_ci_upper2[
-                        str(model_list[m])
-                    ].values
-            if not y_lim_lock:
-                if metric2_name is not None:
-                    y_vals_both_metrics = np.concatenate((y_vals_metric1, y_vals_metric2))
-                    if np.any(y_vals_both_metrics != np.inf):
-                        y_vals_metric_min = np.nanmin(y_vals_both_metrics[y_vals_both_metrics != np.inf])
-                        y_vals_metric_max = np.nanmax(y_vals_both_metrics[y_vals_both_metrics != np.inf])
-                    else:
-                        y_vals_metric_min = np.nanmin(y_vals_both_metrics)
-                        y_vals_metric_max = np.nanmax(y_vals_both_metrics)
-                else:
-                    if np.any(y_vals_metric1 != np.inf):
-                        y_vals_metric_min = np.nanmin(y_vals_metric1[y_vals_metric1 != np.inf])
-                        y_vals_metric_max = np.nanmax(y_vals_metric1[y_vals_metric1 != np.inf])
-                    else:
-                        y_vals_metric_min = np.nanmin(y_vals_metric1)
-                        y_vals_metric_max = np.nanmax(y_vals_metric1)
-                if n_mods == 0:
-                    y_mod_min = y_vals_metric_min
-                    y_mod_max = y_vals_metric_max
-                    counts = pivot_counts[str(model_list[m])].values
-                    n_mods+=1
-                else:
-                    if math.isinf(y_mod_min):
-                        y_mod_min = y_vals_metric_min
-                    else:
-                        y_mod_min = np.nanmin([y_mod_min, y_vals_metric_min])
-                    if math.isinf(y_mod_max):
-                        y_mod_max = y_vals_metric_max
-                    else:
-                        y_mod_max = np.nanmax([y_mod_max, y_vals_metric_max])
-                if (y_vals_metric_min > y_min_limit 
-                        and y_vals_metric_min <= y_mod_min):
-                    y_min = y_vals_metric_min
-                if (y_vals_metric_max < y_max_limit 
-                        and y_vals_metric_max >= y_mod_max):
-                    y_max = y_vals_metric_max
+                    y_vals_ci_lower2 = arr_ci_lower2[:, cols_ci2[model_name]]
+                    y_vals_ci_upper2 = arr_ci_upper2[:, cols_ci2[model_name]]
             if np.abs(y_vals_metric1_mean) < 1E4:
                 metric1_mean_fmt_string = f'{y_vals_metric1_mean:.2f}'
             else:
                 metric1_mean_fmt_string = f'{y_vals_metric1_mean:.2E}'
             if plot_reference[0]:
                 if not plotted_reference[0]:
-                    ref_color_dict = model_colors.get_color_dict('obs')
                     plt.plot(
-                        x_vals1.tolist(), reference1,
-                        marker=ref_color_dict['marker'],
-                        c=ref_color_dict['color'], mew=2., mec='white',
-                        figure=fig, ms=ref_color_dict['markersize'], ls='solid',
-                        lw=ref_color_dict['linewidth']
+                        x_vals1_list, reference1,
+                        marker=obs_marker,
+                        c=obs_color, mew=2., mec='white',
+                        figure=fig, ms=obs_ms, ls='solid',
+                        lw=obs_lw
                     )
                     plotted_reference[0] = True
             else:
-                plt.plot(
-                    x_vals1.tolist(), y_vals_metric1, 
-                    marker=mod_setting_dicts[m]['marker'], 
-                    c=mod_setting_dicts[m]['color'], mew=2., mec='white', 
-                    figure=fig, ms=mod_setting_dicts[m]['markersize'], ls='solid', 
-                    lw=mod_setting_dicts[m]['linewidth']
-                )
+                mod_lines1.append({
+                    'x': x_nums1, 'y': y_vals_metric1, 'color': mod_color, 
+                    'marker': mod_marker, 'linewidth': mod_lw, 
+                    'markersize': mod_ms
+                })
             if metric2_name is not None:
                 if np.abs(y_vals_metric2_mean) < 1E4:
                     metric2_mean_fmt_string = f'{y_vals_metric2_mean:.2f}'
@@ -806,73 +935,55 @@ class Plotter():
                     metric2_mean_fmt_string = f'{y_vals_metric2_mean:.2E}'
                 if plot_reference[1]:
                     if not plotted_reference[1]:
-                        ref_color_dict = model_colors.get_color_dict('obs')
                         plt.plot(
-                            x_vals2.tolist(), reference2,
-                            marker=ref_color_dict['marker'],
-                            c=ref_color_dict['color'], mew=2., mec='white',
-                            figure=fig, ms=ref_color_dict['markersize'], ls='dashed',
-                            lw=ref_color_dict['linewidth']
+                            x_vals2_list, reference2,
+                            marker=obs_marker,
+                            c=obs_color, mew=2., mec='white',
+                            figure=fig, ms=obs_ms, ls='dashed',
+                            lw=obs_lw
                         )
                         plotted_reference[1] = True
                 else:
-                    plt.plot(
-                        x_vals2.tolist(), y_vals_metric2, 
-                        marker=mod_setting_dicts[m]['marker'], 
-                        c=mod_setting_dicts[m]['color'], mew=2., mec='white', 
-                        figure=fig, ms=mod_setting_dicts[m]['markersize'], 
-                        ls='dashed', lw=mod_setting_dicts[m]['linewidth']
-                    )
+                    mod_lines2.append({
+                        'x': x_nums2, 'y': y_vals_metric2, 'color': mod_color, 
+                        'marker': mod_marker, 'linewidth': mod_lw, 
+                        'markersize': mod_ms
+                    })
             if confidence_intervals:
                 if plot_reference[0]:
                     if not plotted_reference_CIs[0]:
-                        ref_color_dict = model_colors.get_color_dict('obs')
-                        plt.errorbar(
-                            x_vals1.tolist(), reference1,
-                            yerr=[np.abs(reference_ci_lower1), reference_ci_upper1],
-                            fmt='none', ecolor=ref_color_dict['color'],
-                            elinewidth=ref_color_dict['linewidth'],
-                            capsize=10., capthick=ref_color_dict['linewidth'],
-                            alpha=.70, zorder=0
-                        )
+                        ci_bars.append({
+                            'x': x_nums1, 'y': reference1, 
+                            'lower': reference_ci_lower1, 
+                            'upper': reference_ci_upper1, 'color': obs_color, 
+                            'linewidth': obs_lw
+                        })
                         plotted_reference_CIs[0] = True
                 else:
-                    plt.errorbar(
-                        x_vals1.tolist(), y_vals_metric1,
-                        yerr=[np.abs(y_vals_ci_lower1), y_vals_ci_upper1],
-                        fmt='none', ecolor=mod_setting_dicts[m]['color'],
-                        elinewidth=mod_setting_dicts[m]['linewidth'],
-                        capsize=10., capthick=mod_setting_dicts[m]['linewidth'],
-                        alpha=.70, zorder=0
-                    )
+                    ci_bars.append({
+                        'x': x_nums1, 'y': y_vals_metric1, 
+                        'lower': y_vals_ci_lower1, 'upper': y_vals_ci_upper1, 
+                        'color': mod_color, 'linewidth': mod_lw
+                    })
                 if metric2_name is not None:
                     if plot_reference[1]:
                         if not plotted_reference_CIs[1]:
-                            ref_color_dict = model_colors.get_color_dict('obs')
-                            plt.errorbar(
-                                x_vals2.tolist(), reference2,
-                                yerr=[np.abs(reference_ci_lower2), reference_ci_upper2],
-                                fmt='none', ecolor=ref_color_dict['color'],
-                                elinewidth=ref_color_dict['linewidth'],
-                                capsize=10., capthick=ref_color_dict['linewidth'],
-                                alpha=.70, zorder=0
-                            )
+                            ci_bars.append({
+                                'x': x_nums2, 'y': reference2, 
+                                'lower': reference_ci_lower2, 
+                                'upper': reference_ci_upper2, 
+                                'color': obs_color, 'linewidth': obs_lw
+                            })
                             plotted_reference_CIs[1] = True
                     else:
-                        plt.errorbar(
-                            x_vals2.tolist(), y_vals_metric2,
-                            yerr=[np.abs(y_vals_ci_lower2), y_vals_ci_upper2],
-                            fmt='none', ecolor=mod_setting_dicts[m]['color'],
-                            elinewidth=mod_setting_dicts[m]['linewidth'],
-                            capsize=10., capthick=mod_setting_dicts[m]['linewidth'],
-                            alpha=.70, zorder=0
-                        )
+                        ci_bars.append({
+                            'x': x_nums2, 'y': y_vals_metric2, 
+                            'lower': y_vals_ci_lower2, 
+                            'upper': y_vals_ci_upper2, 'color': mod_color, 
+                            'linewidth': mod_lw
+                        })
             handles+=[
-                self.f(
-                    mod_setting_dicts[m]['marker'], mod_setting_dicts[m]['color'],
-                    'solid', mod_setting_dicts[m]['linewidth'], 
-                    mod_setting_dicts[m]['markersize'], 'white'
-                )
+                self.f(mod_marker, mod_color, 'solid', mod_lw, mod_ms, 'white')
             ]
             if display_averages:
                 if metric2_name is not None:
@@ -887,4 +998,11 @@ class Plotter():
             else:
                 labels+=[f'{model_plot_name}']
 
+        if ci_bars:
+            self.get_errorbar_collection(ax, ci_bars)
+        if mod_lines1:
+            self.get_line_collection(ax, mod_lines1, ls='solid')
+        if mod_lines2:
+            self.get_line_collection(ax, mod_lines2, ls='dashed')
+
         return (fig, y_min, y_max, handles, labels)
@@ -15,19 +15,29 @@
 
 import os
 import sys
+import re
 import numpy as np
 import math
 import pandas as pd
 import logging
+import logging.handlers
+import atexit
 from functools import reduce
 import matplotlib
 matplotlib.use('agg')
+# Stroke long lines (many dates, many models) in chunks in the Agg renderer
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+# The figure is sized and laid out explicitly, so always save without a 
+# tight bounding box (which renders the figure twice)
+matplotlib.rcParams['savefig.bbox'] = 'standard'
 import matplotlib.pyplot as plt
 import matplotlib.colors as colors
 import matplotlib.image as mpimg
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
 from datetime import datetime, timedelta as td
-import shutil
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 SETTINGS_DIR = os.environ['USH_DIR']
 sys.path.insert(0, os.path.abspath(SETTINGS_DIR))
@@ -49,6 +59,22 @@ presets = Presets()
 model_colors = ModelSpecs()
 reference = Reference()
 
+# Valid threshold and level sets, by id of the settings var_specs dictionary
+_var_specs_sets = {}
+
+# Directories already created (or found) by this process
+_mkdir_cache = set()
+
+# Splits a comma-separated list of levels, but not at commas inside a level
+_LEVEL_SPLIT_RE = re.compile(r',(?![0*])')
+
+# Logged (%-style) when no stats are left to plot after pivoting
+_EMPTY_PIVOT_MSG_TEMPLATE = (
+    "Could not find (and cannot plot) %s stats for %s at any level. "
+    "This often happens when processed data are all NaNs,  which are "
+    "removed.  Check for seasonal cases where critical  threshold is not "
+    "reached. Continuing ..."
+)
 
 # =================== FUNCTIONS =========================
 
@@ -89,17 +115,16 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
         logger.info("========================================")
         return None
 
-    fig, ax = plotter.get_plots(num)  
+    fig, ax = plotter.get_pooled_plots(dpi)
     variable_translator = reference.variable_translator
     domain_translator = reference.domain_translator
     model_settings = model_colors.model_settings
 
-    # filter by level
-    df = df[df['FCST_LEV'].astype(str).eq(str(level))]
+    # filter by level (FCST_LEV is already read in as str by df_preprocessing)
+    df = df[df['FCST_LEV'].eq(str(level))]
 
     if df.empty:
         logger.warning(f"Empty Dataframe. Continuing onto next plot...")
-        plt.close(num)
         logger.info("========================================")
         return None
 
@@ -110,14 +135,11 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
 
     # Remove from date_hours the valid/init hours that don't exist in the 
     # dataframe
-    date_hours = np.array(date_hours)[[
-        str(x) in df[str(date_type).upper()].dt.hour.astype(str).tolist() 
-        for x in date_hours
-    ]]
+    present_hours = df[str(date_type).upper()].dt.hour.unique()
+    date_hours = np.asarray(date_hours)[np.isin(date_hours, present_hours)]
 
     if df.empty:
         logger.warning(f"Empty Dataframe. Continuing onto next plot...")
-        plt.close(num)
         logger.info("========================================")
         return None
 
@@ -136,7 +158,6 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
 
     if df.empty:
         logger.warning(f"Empty Dataframe. Continuing onto next plot...")
-        plt.close(num)
         logger.info("========================================")
         return None
 
@@ -152,12 +173,14 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
             sample_equalization = False
         if df.empty:
             logger.warning(f"Empty Dataframe. Continuing onto next plot...")
-            plt.close(num)
             logger.info("========================================")
             return None
 
     # Aggregate unit statistics and calculate metrics
-    df_groups = df.groupby(group_by)
+    # Note: rows are pre-sorted by the group keys so that groupby can skip its
+    # own sort while keeping the groups in the same (sorted) order
+    df = df.sort_values(group_by, kind='mergesort')
+    df_groups = df.groupby(group_by, sort=False, observed=True)
     metrics_using_var_units = [
         'BCRMSE','RMSE','BIAS','ME','FBAR','OBAR','MAE','FBAR_OBAR',
         'SPEED_ERR','DIR_ERR','RMSVE','VDIFF_SPEED','VDIF_DIR',
@@ -192,28 +215,18 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
     pivot_metric1, pivot_metric2, pivot_counts = pivot_tables[:3]
     pivot_ci_lower1, pivot_ci_upper1 = pivot_tables[3:5]
     pivot_ci_lower2, pivot_ci_upper2 = pivot_tables[5:]
-    if (metric2_name and (pivot_metric1.empty or pivot_metric2.empty)):
-        print_varname = df['FCST_VAR'].tolist()[0]
-        logger.warning(
-            f"Could not find (and cannot plot) {metric1_name} and/or"
-            + f" {metric2_name} stats for {print_varname} at any level. "
-            + f"This often happens when processed data are all NaNs, "
-            + f" which are removed.  Check for seasonal cases where critical "
-            + f" threshold is not reached. Continuing ..."
-        )
-        plt.close(num)
-        logger.info("========================================")
-        return None
-    elif not metric2_name and pivot_metric1.empty:
-        print_varname = df['FCST_VAR'].tolist()[0]
+    if metric2_name:
+        pivot_empty = pivot_metric1.empty or pivot_metric2.empty
+    else:
+        pivot_empty = pivot_metric1.empty
+    if pivot_empty:
+        if metric2_name:
+            metrics_phrase = f'{metric1_name} and/or {metric2_name}'
+        else:
+            metrics_phrase = f'{metric1_name}'
         logger.warning(
-            f"Could not find (and cannot plot) {metric1_name}"
-            + f" stats for {print_varname} at any level. "
-            + f"This often happens when processed data are all NaNs, "
-            + f" which are removed.  Check for seasonal cases where critical "
-            + f" threshold is not reached. Continuing ..."
+            _EMPTY_PIVOT_MSG_TEMPLATE, metrics_phrase, df['FCST_VAR'].iat[0]
         )
-        plt.close(num)
         logger.info("========================================")
         return None
     
@@ -222,31 +235,25 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
 
     # Handle confidence intervals if they're enabled
     if confidence_intervals:
-        indices_in_common1 = list(set.intersection(*map(
-            set, 
-            [
-                pivot_metric1.index, 
-                pivot_ci_lower1.index, 
-                pivot_ci_upper1.index
-            ]
-        )))
-        pivot_metric1 = pivot_metric1[pivot_metric1.index.isin(indices_in_common1)]
-        pivot_ci_lower1 = pivot_ci_lower1[pivot_ci_lower1.index.isin(indices_in_common1)]
-        pivot_ci_upper1 = pivot_ci_upper1[pivot_ci_upper1.index.isin(indices_in_common1)]
+        indices_in_common1 = (
+            pivot_metric1.index
+            .intersection(pivot_ci_lower1.index)
+            .intersection(pivot_ci_upper1.index)
+        )
+        pivot_metric1 = pivot_metric1.loc[indices_in_common1]
+        pivot_ci_lower1 = pivot_ci_lower1.loc[indices_in_common1]
+        pivot_ci_upper1 = pivot_ci_upper1.loc[indices_in_common1]
         if sample_equalization:
-            pivot_counts = pivot_counts[pivot_counts.index.isin(indices_in_common1)]
+            pivot_counts = pivot_counts.loc[indices_in_common1]
         if metric2_name is not None:
-            indices_in_common2 = list(set.intersection(*map(
-                set, 
-                [
-                    pivot_metric2.index, 
-                    pivot_ci_lower2.index, 
-                    pivot_ci_upper2.index
-                ]
-            )))
-            pivot_metric2 = pivot_metric2[pivot_metric2.index.isin(indices_in_common2)]
-            pivot_ci_lower2 = pivot_ci_lower2[pivot_ci_lower2.index.isin(indices_in_common2)]
-            pivot_ci_upper2 = pivot_ci_upper2[pivot_ci_upper2.index.isin(indices_in_common2)]
+            indices_in_common2 = (
+                pivot_metric2.index
+                .intersection(pivot_ci_lower2.index)
+                .intersection(pivot_ci_upper2.index)
+            )
+            pivot_metric2 = pivot_metric2.loc[indices_in_common2]
+            pivot_ci_lower2 = pivot_ci_lower2.loc[indices_in_common2]
+            pivot_ci_upper2 = pivot_ci_upper2.loc[indices_in_common2]
     
     # Set the x-values (index of the pivot tables)
     x_vals1 = pivot_metric1.index
@@ -261,14 +268,15 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
 
     # Handle threshold values if they're defined
     if thresh and '' not in thresh:
-        thresh_labels = np.unique(df['OBS_THRESH_VALUE'])
+        thresh_labels = df['OBS_THRESH_VALUE'].unique()
         thresh_argsort = np.argsort(thresh_labels.astype(float))
-        requested_thresh_argsort = np.argsort([
-            float(item) for item in requested_thresh_value
-        ])
-        thresh_labels = [thresh_labels[i] for i in thresh_argsort]
-        requested_thresh_labels = [
-            requested_thresh_value[i] for i in requested_thresh_argsort
+        requested_thresh_labels = np.asarray(requested_thresh_value)
+        requested_thresh_argsort = np.argsort(
+            requested_thresh_labels.astype(float)
+        )
+        thresh_labels = thresh_labels[thresh_argsort]
+        requested_thresh_labels = requested_thresh_labels[
+            requested_thresh_argsort
         ]
     else:
         thresh_labels = None
@@ -279,7 +287,7 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
         mod_setting_dicts = plot_util.get_model_settings(model_list, model_colors, model_settings)
 
         fig, y_min, y_max, handles, labels = plotter.plot_by_model(
-            fig, pivot_metric1, pivot_metric2, pivot_counts,
+            fig, logger, pivot_metric1, pivot_metric2, pivot_counts,
             pivot_ci_lower1, pivot_ci_upper1, pivot_ci_lower2, pivot_ci_upper2,
             y_min, y_max, y_min_limit, y_max_limit,
             x_vals1, x_vals2, metric1_name, metric2_name,
@@ -322,7 +330,7 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
         mod_setting_dicts = plot_util.get_model_settings(model_list, model_colors, model_settings)
 
         fig, y_min, y_max, handles, labels = plotter.plot_by_model(
-            fig, pivot_metric1, pivot_metric2, pivot_counts,
+            fig, logger, pivot_metric1, pivot_metric2, pivot_counts,
             pivot_ci_lower1, pivot_ci_upper1, pivot_ci_lower2, pivot_ci_upper2,
             y_min, y_max, y_min_limit, y_max_limit,
             x_vals1, x_vals2, metric1_name, metric2_name, 
@@ -347,7 +355,7 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
         xlabel=f'{str(date_type_string).capitalize()} Date' 
 
     # Configure y-axis
-    var_long_name_key = df['FCST_VAR'].tolist()[0]
+    var_long_name_key = df['FCST_VAR'].iat[0]
     if interp_to_metric:
         y_axis_config = plot_util.configure_leads_axis(
             df, y_min, y_max, y_min_limit, y_max_limit, thresh_labels, thresh, 
@@ -402,12 +410,13 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
     
     # Plot sample sizes
     if sample_equalization and show_sample_sizes:
-        counts = pivot_counts.mean(axis=1, skipna=True).fillna('')
-        for count, xval in zip(counts, x_vals1.tolist()):
-            if not isinstance(count, str):
-                count = str(int(count))
+        counts = pivot_counts.mean(axis=1, skipna=True).to_numpy()
+        count_labels = np.where(
+            np.isnan(counts), '', np.nan_to_num(counts).astype(int).astype(str)
+        )
+        for count_label, xval in zip(count_labels, x_vals1.tolist()):
             ax.annotate(
-                f'{count}', xy=(xval,1.), 
+                count_label, xy=(xval,1.), 
                 xycoords=('data','axes fraction'), xytext=(0,12), 
                 textcoords='offset points', va='top', fontsize=11, 
                 color='dimgrey', ha='center'
@@ -570,6 +579,9 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
         time_period_savename = f'{date_start_savename}-{date_end_savename}'
     else:
         time_period_savename = f'{eval_period}'
+    # Lowercase the parts shared by the file name and directories once
+    plot_group_savename = str(plot_group).lower()
+    time_period_savename = str(time_period_savename).lower()
 
     plot_info = '_'.join(
         [item for item in [
@@ -588,43 +600,140 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
     save_name+=f'.{str(var_savename).lower()}'
     if level_savename:
         save_name+=f'_{str(level_savename).lower()}'
-    save_name+=f'.{str(time_period_savename).lower()}'
+    save_name+=f'.{time_period_savename}'
     save_name+=f'.{plot_info}'
     save_name+=f'.{str(domain_save_string).lower()}'
 
     if save_header:
         save_name = f'{save_header}.'+save_name
-    save_subdir = os.path.join(
-        save_dir, f'{str(plot_group).lower()}', 
-        f'{str(time_period_savename).lower()}'
+    # The plot and its restart copy share the same path below their base 
+    # directories
+    save_subdir = os.path.join(plot_group_savename, time_period_savename)
+    save_relpath = os.path.join(save_subdir, save_name+'.png')
+    _ensure_dir(os.path.join(save_dir, save_subdir))
+    save_path = os.path.join(save_dir, save_relpath)
+    # Render the PNG in memory and write it (and its restart copy) in one 
+    # call each, rather than in many small writes.  Fast, light zlib 
+    # compression trades a somewhat larger file for much less encoding time
+    png_buffer = io.BytesIO()
+    fig.savefig(
+        png_buffer, format='png', dpi=dpi, 
+        pil_kwargs={'compress_level': 1, 'optimize': False}
     )
-    if not os.path.isdir(save_subdir):
-        os.makedirs(save_subdir)
-    save_path = os.path.join(save_subdir, save_name+'.png')
-    fig.savefig(save_path, dpi=dpi)
+    png_bytes = png_buffer.getvalue()
+    with open(save_path, 'wb', buffering=1024*1024) as f:
+        f.write(png_bytes)
     if restart_dir:
-        shutil.copy2(
-            save_path, 
-            os.path.join(
-                restart_dir, 
-                f'{str(plot_group).lower()}', 
-                f'{str(time_period_savename).lower()}', 
-                save_name+'.png'
-            )
-        )
+        _ensure_dir(os.path.join(restart_dir, save_subdir))
+        restart_path = os.path.join(restart_dir, save_relpath)
+        # Write the restart copy from the buffer, as an independent file 
+        # (not a link) so later changes to the saved plot do not alter it
+        with open(restart_path, 'wb', buffering=1024*1024) as f:
+            f.write(png_bytes)
     logger.info(u"\u2713"+f" plot saved successfully as {save_path}")
-    plt.close(num)
     logger.info('========================================')
 
 
+def _ensure_dir(path):
+    """! Create a directory (and any parents) if this process has not 
+         already done so
+
+        Args:
+            path - directory to create (string)
+    """
+    if path not in _mkdir_cache:
+        os.makedirs(path, exist_ok=True)
+        _mkdir_cache.add(path)
+
+
+def _sets_for(var_specs):
+    """! Get the valid thresholds and levels of a variable as sets, for O(1) 
+         membership checks.  Memoized per var_specs dictionary
+
+        Args:
+            var_specs - settings for one variable, from the case type's 
+                        'var_dict' (dictionary)
+
+        Returns:
+            fcst_var_thresholds - valid forecast thresholds, always 
+                                  including an empty (unset) threshold 
+                                  (frozenset)
+            obs_var_thresholds  - valid observed thresholds, always 
+                                  including an empty (unset) threshold 
+                                  (frozenset)
+            fcst_var_levels     - valid forecast levels (frozenset)
+            obs_var_levels      - valid observed levels (frozenset)
+    """
+    var_sets = _var_specs_sets.get(id(var_specs))
+    if var_sets is None:
+        var_sets = (
+            frozenset(
+                var_specs['fcst_var_thresholds'].replace(',', ' ').split()
+            ) | {''},
+            frozenset(
+                var_specs['obs_var_thresholds'].replace(',', ' ').split()
+            ) | {''},
+            frozenset(var_specs['fcst_var_levels']),
+            frozenset(var_specs['obs_var_levels'])
+        )
+        _var_specs_sets[id(var_specs)] = var_sets
+    return var_sets
+
+
+def _preprocess_key(preprocess_args):
+    """! Make a hashable key from preprocessing arguments
+
+        Args:
+            preprocess_args - positional arguments to get_preprocessed_data, 
+                              after the logger (tuple)
+
+        Returns:
+            key - the arguments, with lists converted to tuples (tuple)
+    """
+    return tuple(
+        tuple(arg) if isinstance(arg, list) else arg 
+        for arg in preprocess_args
+    )
+
+
+def _init_worker():
+    """! Reseed numpy's global random state in a new worker process.  Forked 
+         workers otherwise inherit the parent's state, and every worker 
+         would draw the same bootstrap resamples
+    """
+    np.random.seed()
+
+
+def _render_group(job_specs):
+    """! Preprocess the data shared by a group of jobs once, then plot the 
+         time series for each job in the group.  Levels are filtered at 
+         plot time, so the jobs for each level of a variable/domain share 
+         the same preprocessed data.  Module-level so it can run in a worker 
+         process
+
+        Args:
+            job_specs - jobs with the same 'preprocess_args'; each a 
+                        dictionary with the 'logger_name', the positional 
+                        'preprocess_args' to get_preprocessed_data (after 
+                        the logger), and the 'plot_kwargs' to 
+                        plot_time_series (list of picklable dictionaries)
+    """
+    logger = logging.getLogger(job_specs[0]['logger_name'])
+    df = df_preprocessing.get_preprocessed_data(
+        logger, *job_specs[0]['preprocess_args']
+    )
+    if df is None:
+        return None
+    for job_spec in job_specs:
+        plot_time_series(df, logger, **job_spec['plot_kwargs'])
+
+
 def main():
 
     # Logging
-    log_metplus_dir = '/'
-    for subdir in LOG_TEMPLATE.split('/')[:-1]:
-        log_metplus_dir = os.path.join(log_metplus_dir, subdir)
-    if not os.path.isdir(log_metplus_dir):
-        os.makedirs(log_metplus_dir)
+    os.makedirs(
+        os.path.join('/', os.path.dirname(LOG_TEMPLATE)), exist_ok=True
+    )
     logger = logging.getLogger(LOG_TEMPLATE)
     logger.setLevel(LOG_LEVEL)
     formatter = logging.Formatter(
@@ -632,9 +741,25 @@ def main():
         + '%(message)s',
         '%m/%d %H:%M:%S'
     )
+    # Records are queued by the logger (and by forked workers) and written 
+    # by a listener thread, in batches through a memory handler.  Anything 
+    # left is written at exit
+    log_queue = multiprocessing.Queue(-1)
     file_handler = logging.FileHandler(LOG_TEMPLATE, mode='a')
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler
+    )
+    listener = logging.handlers.QueueListener(
+        log_queue, memory_handler, respect_handler_level=True
+    )
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    def close_log_handlers():
+        listener.stop()
+        memory_handler.close()
+        file_handler.close()
+    atexit.register(close_log_handlers)
     logger_info = f"Log file: {LOG_TEMPLATE}"
     print(logger_info)
     logger.info(logger_info)
@@ -686,88 +811,95 @@ def main():
                 + f"Setting to default value \"MODEL\""
             )
 
-    logger.debug('========================================')
-    logger.debug("Config file settings")
-    logger.debug(f"LOG_LEVEL: {LOG_LEVEL}")
-    logger.debug(f"MET_VERSION: {MET_VERSION}")
-    logger.debug(f"IMG_HEADER: {IMG_HEADER if IMG_HEADER else 'No header'}")
-    logger.debug(f"STAT_OUTPUT_BASE_DIR: {STAT_OUTPUT_BASE_DIR}")
-    logger.debug(f"STATS_DIR: {STATS_DIR}")
-    logger.debug(f"PRUNE_DIR: {PRUNE_DIR}")
-    logger.debug(f"SAVE_DIR: {SAVE_DIR}")
-    logger.debug(f"RESTART_DIR: {RESTART_DIR}")
-    logger.debug(f"VERIF_CASETYPE: {VERIF_CASETYPE}")
-    logger.debug(f"MODELS: {MODELS}")
-    logger.debug(f"VARIABLES: {VARIABLES}")
-    logger.debug(f"DOMAINS: {DOMAINS}")
-    logger.debug(f"INTERP: {INTERP}")
-    logger.debug(f"DATE_TYPE: {DATE_TYPE}")
-    logger.debug(
-        f"EVAL_PERIOD: {EVAL_PERIOD}"
-    )
-    logger.debug(
-        f"{DATE_TYPE}_BEG: {date_beg}"
-    )
-    logger.debug(
-        f"{DATE_TYPE}_END: {date_end}"
-    )
-    logger.debug(f"VALID_HOURS: {VALID_HOURS}")
-    logger.debug(f"INIT_HOURS: {INIT_HOURS}")
-    logger.debug(f"FCST_LEADS: {FLEADS}")
-    logger.debug(f"FCST_LEVELS: {FCST_LEVELS}")
-    logger.debug(f"OBS_LEVELS: {OBS_LEVELS}")
-    logger.debug(
-        f"FCST_THRESH: {FCST_THRESH if FCST_THRESH else 'No thresholds'}"
-    )
-    logger.debug(
-        f"OBS_THRESH: {OBS_THRESH if OBS_THRESH else 'No thresholds'}"
-    )
-    logger.debug(f"LINE_TYPE: {LINE_TYPE}")
-    logger.debug(f"METRICS: {METRICS}")
-    logger.debug(f"CONFIDENCE_INTERVALS: {CONFIDENCE_INTERVALS}")
-    logger.debug(f"INTERP_PNTS: {INTERP_PNTS if INTERP_PNTS else 'No interpolation points'}")
-
-    logger.debug('----------------------------------------')
-    logger.debug(f"Advanced settings (configurable in {SETTINGS_DIR}/settings.py)")
-    logger.debug(f"Y_MIN_LIMIT: {Y_MIN_LIMIT}")
-    logger.debug(f"Y_MAX_LIMIT: {Y_MAX_LIMIT}")
-    logger.debug(f"Y_LIM_LOCK: {Y_LIM_LOCK}")
-    logger.debug(f"X_MIN_LIMIT: Ignored for time series plots")
-    logger.debug(f"X_MAX_LIMIT: Ignored for time series plots")
-    logger.debug(f"X_LIM_LOCK: Ignored for time series plots")
-    logger.debug(f"Display averages? {'yes' if display_averages else 'no'}")
-    logger.debug(
-        f"Clear prune directories? {'yes' if clear_prune_dir else 'no'}"
-    )
-    logger.debug(f"Plot upper-left logo? {'yes' if plot_logo_left else 'no'}")
-    logger.debug(
-        f"Plot upper-right logo? {'yes' if plot_logo_right else 'no'}"
-    )
-    logger.debug(f"Upper-left logo path: {path_logo_left}")
-    logger.debug(f"Upper-right logo path: {path_logo_right}")
-    logger.debug(
-        f"Upper-left logo fraction of original size: {zoom_logo_left}"
-    )
-    logger.debug(
-        f"Upper-right logo fraction of original size: {zoom_logo_right}"
-    )
-    logger.debug(
-        f"Aggregate dates? {'yes' if aggregate_dates_by else 'no'}"
-    )
-    logger.debug(
-        f"Running mean? {'yes' if running_mean else 'no'}"
-    )
-    logger.debug(
-        f"Coloring lines based on {'metric' if interp_to_metric else 'lead time.' if color_by=='LEAD_HOURS' else 'model.'}"
-    )
-    if CONFIDENCE_INTERVALS:
-        logger.debug(f"Confidence Level: {int(ci_lev*100)}%")
-        logger.debug(f"Bootstrap method: {bs_method}")
-        logger.debug(f"Bootstrap repetitions: {bs_nrep}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('========================================')
+        logger.debug("Config file settings")
+        logger.debug("LOG_LEVEL: %s", LOG_LEVEL)
+        logger.debug("MET_VERSION: %s", MET_VERSION)
+        logger.debug(
+            "IMG_HEADER: %s", IMG_HEADER if IMG_HEADER else 'No header'
+        )
+        logger.debug("STAT_OUTPUT_BASE_DIR: %s", STAT_OUTPUT_BASE_DIR)
+        logger.debug("STATS_DIR: %s", STATS_DIR)
+        logger.debug("PRUNE_DIR: %s", PRUNE_DIR)
+        logger.debug("SAVE_DIR: %s", SAVE_DIR)
+        logger.debug("RESTART_DIR: %s", RESTART_DIR)
+        logger.debug("VERIF_CASETYPE: %s", VERIF_CASETYPE)
+        logger.debug("MODELS: %s", MODELS)
+        logger.debug("VARIABLES: %s", VARIABLES)
+        logger.debug("DOMAINS: %s", DOMAINS)
+        logger.debug("INTERP: %s", INTERP)
+        logger.debug("DATE_TYPE: %s", DATE_TYPE)
+        logger.debug("EVAL_PERIOD: %s", EVAL_PERIOD)
+        logger.debug("%s_BEG: %s", DATE_TYPE, date_beg)
+        logger.debug("%s_END: %s", DATE_TYPE, date_end)
+        logger.debug("VALID_HOURS: %s", VALID_HOURS)
+        logger.debug("INIT_HOURS: %s", INIT_HOURS)
+        logger.debug("FCST_LEADS: %s", FLEADS)
+        logger.debug("FCST_LEVELS: %s", FCST_LEVELS)
+        logger.debug("OBS_LEVELS: %s", OBS_LEVELS)
+        logger.debug(
+            "FCST_THRESH: %s", FCST_THRESH if FCST_THRESH else 'No thresholds'
+        )
+        logger.debug(
+            "OBS_THRESH: %s", OBS_THRESH if OBS_THRESH else 'No thresholds'
+        )
+        logger.debug("LINE_TYPE: %s", LINE_TYPE)
+        logger.debug("METRICS: %s", METRICS)
+        logger.debug("CONFIDENCE_INTERVALS: %s", CONFIDENCE_INTERVALS)
+        logger.debug(
+            "INTERP_PNTS: %s", 
+            INTERP_PNTS if INTERP_PNTS else 'No interpolation points'
+        )
+
+        logger.debug('----------------------------------------')
+        logger.debug(
+            "Advanced settings (configurable in %s/settings.py)", SETTINGS_DIR
+        )
+        logger.debug("Y_MIN_LIMIT: %s", Y_MIN_LIMIT)
+        logger.debug("Y_MAX_LIMIT: %s", Y_MAX_LIMIT)
+        logger.debug("Y_LIM_LOCK: %s", Y_LIM_LOCK)
+        logger.debug("X_MIN_LIMIT: Ignored for time series plots")
+        logger.debug("X_MAX_LIMIT: Ignored for time series plots")
+        logger.debug("X_LIM_LOCK: Ignored for time series plots")
+        logger.debug(
+            "Display averages? %s", 'yes' if display_averages else 'no'
+        )
+        logger.debug(
+            "Clear prune directories? %s", 'yes' if clear_prune_dir else 'no'
+        )
+        logger.debug(
+            "Plot upper-left logo? %s", 'yes' if plot_logo_left else 'no'
+        )
+        logger.debug(
+            "Plot upper-right logo? %s", 'yes' if plot_logo_right else 'no'
+        )
+        logger.debug("Upper-left logo path: %s", path_logo_left)
+        logger.debug("Upper-right logo path: %s", path_logo_right)
+        logger.debug(
+            "Upper-left logo fraction of original size: %s", zoom_logo_left
+        )
         logger.debug(
-            f"Minimum sample size for confidence intervals: {bs_min_samp}"
+            "Upper-right logo fraction of original size: %s", zoom_logo_right
         )
-    logger.debug('========================================')
+        logger.debug(
+            "Aggregate dates? %s", 'yes' if aggregate_dates_by else 'no'
+        )
+        logger.debug("Running mean? %s", 'yes' if running_mean else 'no')
+        logger.debug(
+            "Coloring lines based on %s", 
+            'metric' if interp_to_metric 
+            else 'lead time.' if color_by=='LEAD_HOURS' else 'model.'
+        )
+        if CONFIDENCE_INTERVALS:
+            logger.debug("Confidence Level: %d%%", int(ci_lev*100))
+            logger.debug("Bootstrap method: %s", bs_method)
+            logger.debug("Bootstrap repetitions: %s", bs_nrep)
+            logger.debug(
+                "Minimum sample size for confidence intervals: %s", 
+                bs_min_samp
+            )
+        logger.debug('========================================')
     
     date_range = (
         datetime.strptime(date_beg, '%Y%m%d'), 
@@ -783,13 +915,18 @@ def main():
              + f" provided")
         logger.error(e)
         raise ValueError(e)
-    fcst_thresh_symbol, fcst_thresh_letter = list(
-        zip(*[plot_util.format_thresh(thresh) for thresh in FCST_THRESH])
-    )
-    obs_thresh_symbol, obs_thresh_letter = list(
-        zip(*[plot_util.format_thresh(thresh) for thresh in OBS_THRESH])
-    )
+    fcst_thresh_symbol, fcst_thresh_letter = [], []
+    for thresh in FCST_THRESH:
+        thresh_symbol, thresh_letter = plot_util.format_thresh(thresh)
+        fcst_thresh_symbol.append(thresh_symbol)
+        fcst_thresh_letter.append(thresh_letter)
+    obs_thresh_symbol, obs_thresh_letter = [], []
+    for thresh in OBS_THRESH:
+        thresh_symbol, thresh_letter = plot_util.format_thresh(thresh)
+        obs_thresh_symbol.append(thresh_symbol)
+        obs_thresh_letter.append(thresh_letter)
     num=0
+    jobs = []
     e = ''
     if str(VERIF_CASETYPE).lower() not in list(reference.case_type.keys()):
         e = (f"FATAL ERROR: The requested verification case/type combination is not valid:"
@@ -808,27 +945,50 @@ def main():
         logger.error(e)
         logger.error("Quitting ...")
         raise ValueError(e+"\nQuitting ...")
-    if (str(INTERP).upper()
-            not in case_specs['interp'].replace(' ','').split(',')):
+    # Valid options for the case type as sets, for O(1) membership checks
+    interp_set = frozenset(case_specs['interp'].replace(' ','').split(','))
+    plot_stats_set = frozenset(
+        case_specs['plot_stats_list'].replace(' ','').split(',')
+    )
+    vx_mask_set = frozenset(case_specs['vx_mask_list'])
+    if str(INTERP).upper() not in interp_set:
         e = (f"FATAL ERROR: The requested interp method is not valid for the"
              + f" requested case type ({VERIF_CASETYPE}) and"
              + f" line_type ({LINE_TYPE}): {INTERP}")
         logger.error(e)
         logger.error("Quitting ...")
         raise ValueError(e+"\nQuitting ...")
+    # Drop invalid metrics before any data are read, so that they are 
+    # neither preprocessed nor plotted
+    valid_metrics = []
     for metric in metrics:
-        if metric is not None:
-            if (str(metric).lower() 
-                    not in case_specs['plot_stats_list']
-                    .replace(' ','').split(',')):
-                e = (f"The requested metric is not valid for the"
-                     + f" requested case type ({VERIF_CASETYPE}) and"
-                     + f" line_type ({LINE_TYPE}): {metric}")
-                logger.warning(e)
-                logger.warning("Continuing ...")
-                continue
+        if metric is None:
+            continue
+        if str(metric).lower() not in plot_stats_set:
+            e = (f"The requested metric is not valid for the"
+                 + f" requested case type ({VERIF_CASETYPE}) and"
+                 + f" line_type ({LINE_TYPE}): {metric}")
+            logger.warning(e)
+            logger.warning("Continuing ...")
+            continue
+        valid_metrics.append(metric)
+    if not valid_metrics:
+        e = (f"FATAL ERROR: None of the requested metrics are valid for the"
+             + f" requested case type ({VERIF_CASETYPE}) and"
+             + f" line_type ({LINE_TYPE}): {METRICS}")
+        logger.error(e)
+        logger.error("Quitting ...")
+        raise ValueError(e+"\nQuitting ...")
+    metrics = (valid_metrics+[None])[:2]
+    # The requested levels are the same for every variable
+    fcst_levels = _LEVEL_SPLIT_RE.split(
+        presets.level_presets.get(FCST_LEVELS, FCST_LEVELS).replace(' ','')
+    )
+    obs_levels = _LEVEL_SPLIT_RE.split(
+        presets.level_presets.get(OBS_LEVELS, OBS_LEVELS).replace(' ','')
+    )
     for requested_var in VARIABLES:
-        if requested_var in list(case_specs['var_dict'].keys()):
+        if requested_var in case_specs['var_dict']:
             var_specs = case_specs['var_dict'][requested_var]
         else:
             e = (f"The requested variable is not valid for the requested case"
@@ -839,26 +999,30 @@ def main():
             continue
         fcst_var_names = var_specs['fcst_var_names']
         obs_var_names = var_specs['obs_var_names']
-        symbol_keep = []
-        letter_keep = []
-        for fcst_thresh, obs_thresh in list(
-                zip(*[fcst_thresh_symbol, obs_thresh_symbol])):
-            if (fcst_thresh in var_specs['fcst_var_thresholds']
-                    and obs_thresh in var_specs['obs_var_thresholds']):
-                symbol_keep.append(True)
-            else:
-                symbol_keep.append(False)
-        for fcst_thresh, obs_thresh in list(
-                zip(*[fcst_thresh_letter, obs_thresh_letter])):
-            if (fcst_thresh in var_specs['fcst_var_thresholds']
-                    and obs_thresh in var_specs['obs_var_thresholds']):
-                letter_keep.append(True)
-            else:
-                letter_keep.append(False)
-        keep = np.add(letter_keep, symbol_keep)
-        dropped_items = np.array(FCST_THRESH)[~keep].tolist()
-        fcst_thresh = np.array(FCST_THRESH)[keep].tolist()
-        obs_thresh = np.array(OBS_THRESH)[keep].tolist()
+        (
+            fcst_var_thresholds, obs_var_thresholds, 
+            fcst_var_levels, obs_var_levels
+        ) = _sets_for(var_specs)
+        # Keep a threshold if either its symbol or its letter form is valid
+        keep = [
+            (fcst_symbol in fcst_var_thresholds 
+                and obs_symbol in obs_var_thresholds)
+            or (fcst_letter in fcst_var_thresholds 
+                and obs_letter in obs_var_thresholds)
+            for fcst_symbol, obs_symbol, fcst_letter, obs_letter in zip(
+                fcst_thresh_symbol, obs_thresh_symbol, 
+                fcst_thresh_letter, obs_thresh_letter
+            )
+        ]
+        dropped_items = [
+            thresh for thresh, kept in zip(FCST_THRESH, keep) if not kept
+        ]
+        fcst_thresh = [
+            thresh for thresh, kept in zip(FCST_THRESH, keep) if kept
+        ]
+        obs_thresh = [
+            thresh for thresh, kept in zip(OBS_THRESH, keep) if kept
+        ]
         if dropped_items:
             dropped_items_string = ', '.join(dropped_items)
             e = (f"The requested thresholds are not valid for the requested"
@@ -867,14 +1031,6 @@ def main():
             logger.warning(e)
             logger.warning("Continuing ...")
         plot_group = var_specs['plot_group']
-        if FCST_LEVELS in presets.level_presets:
-            fcst_levels = re.split(r',(?![0*])', presets.level_presets[FCST_LEVELS].replace(' ',''))
-        else:
-            fcst_levels = re.split(r',(?![0*])', FCST_LEVELS.replace(' ',''))
-        if OBS_LEVELS in presets.level_presets:
-            obs_levels = re.split(r',(?![0*])', presets.level_presets[OBS_LEVELS].replace(' ',''))
-        else:
-            obs_levels = re.split(r',(?![0*])', OBS_LEVELS.replace(' ',''))
         for l, fcst_level in enumerate(fcst_levels):
             if len(fcst_levels) != len(obs_levels):
                 e = ("FATAL ERROR: FCST_LEVELS and OBS_LEVELS must be lists of the same"
@@ -882,61 +1038,101 @@ def main():
                 logger.error(e)
                 logger.error("Quitting ...")
                 raise ValueError(e+"\nQuitting ...")
-            if (fcst_levels[l] not in var_specs['fcst_var_levels'] 
-                    or obs_levels[l] not in var_specs['obs_var_levels']):
+            if (fcst_levels[l] not in fcst_var_levels 
+                    or obs_levels[l] not in obs_var_levels):
                 e = (f"The requested variable/level combination is not valid: "
                      + f"{requested_var}/{level}")
                 logger.warning(e)
                 continue
             for domain in DOMAINS:
-                if str(domain) not in case_specs['vx_mask_list']:
+                if str(domain) not in vx_mask_set:
                     e = (f"The requested domain is not valid for the"
                          + f" requested case type ({VERIF_CASETYPE}) and"
                          + f" line_type ({LINE_TYPE}): {domain}")
                     logger.warning(e)
                     logger.warning("Continuing ...")
                     continue
-                df = df_preprocessing.get_preprocessed_data(
-                    logger, STATS_DIR, PRUNE_DIR, OUTPUT_BASE_TEMPLATE, VERIF_CASE, 
-                    VERIF_TYPE, LINE_TYPE, DATE_TYPE, date_range, EVAL_PERIOD, 
-                    date_hours, FLEADS, requested_var, fcst_var_names, 
-                    obs_var_names, MODELS, domain, INTERP, INTERP_PNTS, MET_VERSION, 
-                    clear_prune_dir
-                )
-                if df is None:
-                    continue
-                plot_time_series(
-                    df, logger, date_range, MODELS, num=num, flead=FLEADS, 
-                    level=fcst_level, thresh=obs_thresh, 
-                    metric1_name=metrics[0], metric2_name=metrics[1], 
-                    date_type=DATE_TYPE, date_type_string=date_type_string,
-                    y_min_limit=Y_MIN_LIMIT, 
-                    y_max_limit=Y_MAX_LIMIT, y_lim_lock=Y_LIM_LOCK, 
-                    verif_type=VERIF_TYPE, date_hours=date_hours, 
-                    line_type=LINE_TYPE, save_dir=SAVE_DIR, 
-                    restart_dir=RESTART_DIR, eval_period=EVAL_PERIOD, 
-                    display_averages=display_averages, 
-                    keep_shared_events_only=keep_shared_events_only,
-                    save_header=IMG_HEADER, plot_group=plot_group,
-                    confidence_intervals=CONFIDENCE_INTERVALS,
-                    interp_pts=INTERP_PNTS,
-                    bs_nrep=bs_nrep, bs_method=bs_method, ci_lev=ci_lev,
-                    bs_min_samp=bs_min_samp,
-                    sample_equalization=sample_equalization,
-                    show_sample_sizes=show_sample_sizes,
-                    plot_logo_left=plot_logo_left,
-                    plot_logo_right=plot_logo_right,
-                    path_logo_left=path_logo_left,
-                    path_logo_right=path_logo_right,
-                    zoom_logo_left=zoom_logo_left,
-                    zoom_logo_right=zoom_logo_right,
-                    aggregate_dates_by=aggregate_dates_by,
-                    running_mean=running_mean, color_by=color_by,
-                    interp_to_metric=interp_to_metric, 
-                    target_metric_vals=target_metric_vals
-                )
+                jobs.append({
+                    'logger_name': LOG_TEMPLATE,
+                    'preprocess_args': (
+                        STATS_DIR, PRUNE_DIR, OUTPUT_BASE_TEMPLATE, VERIF_CASE, 
+                        VERIF_TYPE, LINE_TYPE, DATE_TYPE, date_range, 
+                        EVAL_PERIOD, date_hours, FLEADS, requested_var, 
+                        fcst_var_names, obs_var_names, MODELS, domain, INTERP, 
+                        INTERP_PNTS, MET_VERSION, clear_prune_dir
+                    ),
+                    'plot_kwargs': dict(
+                        date_range=date_range, model_list=MODELS, num=num, 
+                        flead=FLEADS, level=fcst_level, thresh=obs_thresh, 
+                        metric1_name=metrics[0], metric2_name=metrics[1], 
+                        date_type=DATE_TYPE, date_type_string=date_type_string,
+                        y_min_limit=Y_MIN_LIMIT, 
+                        y_max_limit=Y_MAX_LIMIT, y_lim_lock=Y_LIM_LOCK, 
+                        verif_type=VERIF_TYPE, date_hours=date_hours, 
+                        line_type=LINE_TYPE, save_dir=SAVE_DIR, 
+                        restart_dir=RESTART_DIR, eval_period=EVAL_PERIOD, 
+                        display_averages=display_averages, 
+                        keep_shared_events_only=keep_shared_events_only,
+                        save_header=IMG_HEADER, plot_group=plot_group,
+                        confidence_intervals=CONFIDENCE_INTERVALS,
+                        interp_pts=INTERP_PNTS,
+                        bs_nrep=bs_nrep, bs_method=bs_method, ci_lev=ci_lev,
+                        bs_min_samp=bs_min_samp,
+                        sample_equalization=sample_equalization,
+                        show_sample_sizes=show_sample_sizes,
+                        plot_logo_left=plot_logo_left,
+                        plot_logo_right=plot_logo_right,
+                        path_logo_left=path_logo_left,
+                        path_logo_right=path_logo_right,
+                        zoom_logo_left=zoom_logo_left,
+                        zoom_logo_right=zoom_logo_right,
+                        aggregate_dates_by=aggregate_dates_by,
+                        running_mean=running_mean, color_by=color_by,
+                        interp_to_metric=interp_to_metric, 
+                        target_metric_vals=target_metric_vals
+                    )
+                })
                 num+=1
 
+    # Jobs that share preprocessing arguments are run together, so their 
+    # data are preprocessed (and pruned) only once
+    job_groups = {}
+    for job_spec in jobs:
+        job_groups.setdefault(
+            _preprocess_key(job_spec['preprocess_args']), []
+        ).append(job_spec)
+
+    # Each group is independent, so preprocess and plot them in parallel 
+    # worker processes.  Workers are forked so they inherit the configured 
+    # logger and module state
+    if (SINGLECORE or len(job_groups) <= 1 
+            or 'fork' not in multiprocessing.get_all_start_methods()):
+        for job_specs in job_groups.values():
+            _render_group(job_specs)
+    else:
+        # Only use the cores allotted to this job, which on shared or batch 
+        # nodes can be fewer than the node has
+        if hasattr(os, 'sched_getaffinity'):
+            available_cpus = len(os.sched_getaffinity(0))
+        else:
+            available_cpus = os.cpu_count() or 1
+        max_workers = min(len(job_groups), available_cpus)
+        logger.info(
+            f"Plotting {len(jobs)} jobs in {len(job_groups)} groups across"
+            + f" {max_workers} processes"
+        )
+        with ProcessPoolExecutor(
+                max_workers=max_workers, 
+                mp_context=multiprocessing.get_context('fork'),
+                initializer=_init_worker) as executor:
+            futures = [
+                executor.submit(_render_group, job_specs) 
+                for job_specs in job_groups.values()
+            ]
+            for future in as_completed(futures):
+                # Re-raise any error from the worker
+                future.result()
+
 
 # ============ START USER CONFIGURATIONS ================
 
@@ -1071,4 +1267,9 @@ if __name__ == "__main__":
     CONFIDENCE_INTERVALS = str(CONFIDENCE_INTERVALS).lower() in [
         'true', '1', 't', 'y', 'yes'
     ]
+    # Whether or not to plot every job in this process instead of in a pool 
+    # of worker processes (useful for debugging)
+    SINGLECORE = str(os.environ.get('SINGLECORE', 'False')).lower() in [
+        'true', '1', 't', 'y', 'yes'
+    ]
     main()